@@ -20,10 +20,11 @@ from typing import (
     Awaitable,
     Callable,
     Type,
+    Generator,
 )
 from types import TracebackType
 
-from ._typing import T, AnyIterable
+from ._typing import T, R, AnyIterable
 
 
 class Sentinel:
@@ -51,7 +52,10 @@ def aiter(subject: AnyIterable[T]) -> AsyncIterator[T]:
     method with integer arguments starting at 0).
     In either case, an async iterator is returned.
     """
-    if isinstance(subject, AsyncIterable):
+    # async iterators must return themselves from ``__aiter__``
+    if hasattr(subject, "__anext__"):
+        return subject  # type: ignore
+    elif isinstance(subject, AsyncIterable):
         return subject.__aiter__()
     else:
         return _aiter_sync(subject).__aiter__()
@@ -108,6 +112,22 @@ def awaitify(
         return Awaitify(function)
 
 
+async def probe_call(
+    function: "Callable[..., Awaitable[T]] | Callable[..., T]", *args: Any
+) -> "tuple[T, bool]":
+    """
+    Call ``function`` once to find out whether it is async
+
+    Provides the result of ``function(*args)``, awaited if needed, and whether
+    ``function`` returned an awaitable. This allows to pick a specialised loop
+    that only uses ``await`` when ``function`` actually needs it.
+    """
+    result = function(*args)
+    if isinstance(result, Awaitable):
+        return await result, True
+    return result, False
+
+
 class Awaitify(Generic[T]):
     """Helper to peek at the return value of ``function`` and make it ``async``"""
 
@@ -130,6 +150,23 @@ class Awaitify(Generic[T]):
             return async_call(*args, **kwargs)
 
 
+class AwaitableValue(Generic[R]):
+    """Helper to provide an arbitrary value in ``await``"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: R):
+        self.value = value
+
+    # noinspection PyUnreachableCode
+    def __await__(self) -> Generator[None, None, R]:
+        return self.value
+        yield  # type: ignore # pragma: no cover
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+
 async def await_value(value: T) -> T:
     return value
 
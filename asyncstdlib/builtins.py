@@ -20,6 +20,7 @@ from ._core import (
     ScopedIter,
     awaitify as _awaitify,
     Sentinel,
+    probe_call,
 )
 
 
@@ -167,9 +168,10 @@ async def _zip_inner(
     aiters: Tuple[AsyncIterator[T], ...]
 ) -> AsyncIterator[Tuple[T, ...]]:
     """Direct zip transposing tuple-of-iterators to iterator-of-tuples"""
+    anexts = [it.__anext__ for it in aiters]
     try:
         while True:
-            yield (*[await anext(it) for it in aiters],)
+            yield (*[await it_anext() for it_anext in anexts],)
     except StopAsyncIteration:
         return
 
@@ -180,11 +182,12 @@ async def _zip_inner_strict(
     """Length aware zip checking that all iterators are equal length"""
     # track index of the last iterator we tried to anext
     tried = 0
+    anexts = [it.__anext__ for it in aiters]
     try:
         while True:
             items: _sync_builtins.list[T] = []
-            for tried, _aiter in _sync_builtins.enumerate(aiters):  # noqa: B007
-                items.append(await anext(_aiter))
+            for tried, it_anext in _sync_builtins.enumerate(anexts):  # noqa: B007
+                items.append(await it_anext())
             yield (*items,)
     except StopAsyncIteration:
         # after the first iterable provided an item, some later iterable was empty
@@ -298,6 +301,8 @@ async def _min_max(
 
     :param invert: compute ``max`` if ``True`` and ``min`` otherwise
     """
+    if key is None and not isinstance(iterable, AsyncIterable):
+        return _min_max_sync(iterable, invert, default)
     async with ScopedIter(iterable) as item_iter:
         best = await anext(item_iter, default=default)
         # this implies that item_iter is empty and default is __MIN_MAX_DEFAULT
@@ -319,6 +324,23 @@ async def _min_max(
     return best
 
 
+def _min_max_sync(
+    iterable: Iterable[LT],
+    invert: bool,
+    default: LT,
+) -> LT:
+    """Implementation of ``min``/``max`` for a regular iterable without key"""
+    item_iter = _sync_builtins.iter(iterable)
+    best = next(item_iter, default)
+    if best is __MIN_MAX_DEFAULT:  # type: ignore
+        name = "max" if invert else "min"
+        raise ValueError(f"{name}() arg is an empty sequence")
+    for item in item_iter:
+        if invert ^ (item < best):
+            best = item
+    return best
+
+
 async def filter(
     function: Union[Callable[[T], bool], Callable[[T], Awaitable[bool]], None],
     iterable: AnyIterable[T],
@@ -337,10 +359,21 @@ async def filter(
             async for item in item_iter:
                 if item:
                     yield item
+            return
+        async for item in item_iter:
+            keep, is_async = await probe_call(function, item)
+            break
         else:
-            function = _awaitify(function)
+            return
+        if keep:
+            yield item
+        if is_async:
             async for item in item_iter:
-                if await function(item):
+                if await function(item):  # type: ignore
+                    yield item
+        else:
+            async for item in item_iter:
+                if function(item):
                     yield item
 
 
@@ -366,8 +399,13 @@ async def sum(iterable: AnyIterable[Any], start: Any = 0) -> Any:
     Sum of ``start`` and all elements in the (async) iterable
     """
     total = start
-    async for item in aiter(iterable):
-        total += item
+    if isinstance(iterable, AsyncIterable):
+        async for item in aiter(iterable):
+            total += item
+    else:
+        # regular iterables do not need the async iteration machinery
+        for item in iterable:
+            total += item
     return total
 
 
@@ -7,12 +7,12 @@ from typing import (
     Union,
     Any,
     Awaitable,
-    Deque,
+    List,
     AsyncContextManager,
 )
 from functools import wraps
-from collections import deque
 from functools import partial
+from types import MethodType
 import sys
 
 from ._typing import AClose, ContextManager, AC, T, C
@@ -106,13 +106,17 @@ class ContextDecorator(AsyncContextManager[T]):
         return inner  # type: ignore
 
 
+#: exceptions that are promoted to RuntimeError when leaking out of a generator
+_STOP_TYPES = (StopIteration, StopAsyncIteration)
+
+
 class _AsyncGeneratorContextManager(ContextDecorator[T]):
     def __init__(
         self, func: Callable[..., AsyncGenerator[T, None]], args: Any, kwds: Any
     ):
         self.gen = func(*args, **kwds)
         self.__recreate_args = func, args, kwds
-        self.__doc__ = getattr(func, "__doc__", type(self).__doc__)
+        self.__doc__ = getattr(func, "__doc__", None)
 
     def _recreate_cm(self):
         return type(self)(*self.__recreate_args)
@@ -124,48 +128,49 @@ class _AsyncGeneratorContextManager(ContextDecorator[T]):
             raise RuntimeError("generator did not yield to __aenter__") from None
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
-        if exc_type is None:
-            try:
-                await self.gen.__anext__()
-            except StopAsyncIteration:
-                return False
+        if exc_type is not None:
+            return await self._aexit_throw(exc_type, exc_val, exc_tb)
+        # ``async for`` handles the expected StopAsyncIteration for us
+        async for _ in self.gen:
+            raise RuntimeError("generator did not stop after __aexit__")
+        return False
+
+    async def _aexit_throw(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
+        """Exit the context by passing an exception into the generator"""
+        try:
+            # We are being closed as part of (async) generator shutdown.
+            # Use `aclose` to have additional checks for the child to
+            # handle shutdown properly.
+            if exc_type is GeneratorExit:
+                result = await self.gen.aclose()  # type: ignore
             else:
-                raise RuntimeError("generator did not stop after __aexit__")
-        else:
-            try:
-                # We are being closed as part of (async) generator shutdown.
-                # Use `aclose` to have additional checks for the child to
-                # handle shutdown properly.
-                if exc_type is GeneratorExit:
-                    result = await self.gen.aclose()  # type: ignore
-                else:
-                    result = await self.gen.athrow(exc_val)
-            except StopAsyncIteration as exc:
-                return exc is not exc_tb
-            except RuntimeError as exc:
-                if exc is exc_val:
+                result = await self.gen.athrow(exc_val)
+        except StopAsyncIteration as exc:
+            return exc is not exc_tb
+        except RuntimeError as exc:
+            if exc is exc_val:
+                return False
+            # Handle promotion of unhandled Stop[Async]Iteration to RuntimeError
+            if isinstance(exc_val, _STOP_TYPES):
+                if exc.__cause__ is exc_val:
                     return False
-                # Handle promotion of unhandled Stop[Async]Iteration to RuntimeError
-                if isinstance(exc_val, (StopIteration, StopAsyncIteration)):
-                    if exc.__cause__ is exc_val:
-                        return False
+            raise
+        except exc_type as exc:
+            if exc is not exc_val:
                 raise
-            except exc_type as exc:
-                if exc is not exc_val:
-                    raise
+            return False
+        else:
+            # During shutdown, the child generator might be cleaned up early.
+            # In this case,
+            # - the child will return nothing/None,
+            # - we get cleaned up via GeneratorExit as well,
+            # and we should go on with our own cleanup.
+            # This might happen if the child mishandles GeneratorExit as well,
+            # but is the closest we can get to checking the situation.
+            # See https://github.com/maxfischer2781/asyncstdlib/issues/84
+            if exc_type is GeneratorExit and result is None:
                 return False
-            else:
-                # During shutdown, the child generator might be cleaned up early.
-                # In this case,
-                # - the child will return nothing/None,
-                # - we get cleaned up via GeneratorExit as well,
-                # and we should go on with our own cleanup.
-                # This might happen if the child mishandles GeneratorExit as well,
-                # but is the closest we can get to checking the situation.
-                # See https://github.com/maxfischer2781/asyncstdlib/issues/84
-                if exc_type is GeneratorExit and result is None:
-                    return False
-                raise RuntimeError("generator did not stop after throw() in __aexit__")
+            raise RuntimeError("generator did not stop after throw() in __aexit__")
 
 
 @public_module(__name__, "closing")
@@ -193,6 +198,8 @@ class Closing(Generic[AClose]):
                  is eventually closed and only :term:`borrowed <borrowing>` until then.
     """
 
+    __slots__ = ("thing",)
+
     def __init__(self, thing: AClose):
         self.thing = thing
 
@@ -270,7 +277,7 @@ class ExitStack:
     """
 
     def __init__(self) -> None:
-        self._exit_callbacks: Deque[Callable[..., Awaitable[Optional[bool]]]] = deque()
+        self._exit_callbacks: List[Callable[..., Awaitable[Optional[bool]]]] = []
 
     @staticmethod
     async def _aexit_callback(
@@ -293,7 +300,7 @@ class ExitStack:
         added after calling :py:meth:`~.pop_all` are not affected by this.
         """
         new_stack = type(self)()
-        new_stack._exit_callbacks, self._exit_callbacks = self._exit_callbacks, deque()
+        new_stack._exit_callbacks, self._exit_callbacks = self._exit_callbacks, []
         return new_stack
 
     def push(self, exit: SE) -> SE:
@@ -321,6 +328,12 @@ class ExitStack:
         Regardless of internal normalizations, ``exit`` is always returned unchanged.
         This allows using ``push`` as a decorator.
 
+        Since a regular callable may return an awaitable, slow synchronous cleanup
+        can be offloaded using the facilities of the active event loop. For example,
+        an :py:mod:`asyncio` application may use
+        ``exit_stack.push(lambda *exc: asyncio.to_thread(cm.__exit__, *exc))``
+        to run ``cm.__exit__`` in a thread without blocking the event loop.
+
         .. seealso::
 
             When receiving a context manager, this method only sets up ``__aexit__`` or
@@ -387,15 +400,19 @@ class ExitStack:
         (that is, ``await cm.__aenter__()`` throws an exception) it is not exited
         either.
         """
+        # Resolve special methods on the type, as done by the ``async with``
+        # statement. This skips the instance dictionary and lets us use the
+        # lookup cache of the type.
+        cm_type = type(cm)
         try:
-            aexit = cm.__aexit__  # type: ignore
+            aexit = cm_type.__aexit__  # type: ignore
         except AttributeError:
-            aexit = awaitify(
-                cm.__exit__,  # type: ignore
-            )
-            context_value = cm.__enter__()  # type: ignore
+            exit = cm_type.__exit__  # type: ignore
+            context_value = cm_type.__enter__(cm)  # type: ignore
+            aexit = awaitify(MethodType(exit, cm))  # type: ignore
         else:
-            context_value = await cm.__aenter__()  # type: ignore
+            context_value = await cm_type.__aenter__(cm)  # type: ignore
+            aexit = MethodType(aexit, cm)  # type: ignore
         self._exit_callbacks.append(aexit)  # pyright: ignore[reportUnknownArgumentType]
         return context_value  # pyright: ignore[reportUnknownVariableType]
 
@@ -440,6 +457,9 @@ class ExitStack:
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, tb: Any) -> bool:
+        # An empty stack cannot suppress or replace any exception
+        if not self._exit_callbacks:
+            return False
         received_exc = exc_type is not None
         # Even if we don't handle an exception *right now*, we may be part
         # of an exception handler unwinding gracefully. This is our __context__.
@@ -8,13 +8,13 @@ from typing import (
     Generator,
     Optional,
     AsyncContextManager,
+    AsyncIterator,
     Type,
     cast,
 )
 
 from ._typing import T, AC, AnyIterable, R
-from ._core import ScopedIter, awaitify as _awaitify, Sentinel
-from .builtins import anext
+from ._core import ScopedIter, Sentinel, AwaitableValue, probe_call
 from .contextlib import nullcontext
 
 from ._lrucache import (
@@ -48,21 +48,7 @@ def cache(user_function: AC) -> LRUAsyncCallable[AC]:
     return lru_cache(maxsize=None)(user_function)
 
 
-class AwaitableValue(Generic[R]):
-    """Helper to provide an arbitrary value in ``await``"""
-
-    __slots__ = ("value",)
-
-    def __init__(self, value: R):
-        self.value = value
-
-    # noinspection PyUnreachableCode
-    def __await__(self) -> Generator[None, None, R]:
-        return self.value
-        yield  # type: ignore # pragma: no cover
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.value!r})"
+_CACHE_MISSING = Sentinel("<missing>")
 
 
 class _FutureCachedPropertyValue(Generic[R, T]):
@@ -72,6 +58,7 @@ class _FutureCachedPropertyValue(Generic[R, T]):
     When given a lock to coordinate access, only the first task to await on a
     cached property triggers the underlying coroutine. Once a value has been
     produced, all tasks are unblocked and given the same, single value.
+    Without a lock, each task triggers the underlying coroutine directly.
     """
 
     __slots__ = ("_func", "_instance", "_name", "_lock")
@@ -81,7 +68,7 @@ class _FutureCachedPropertyValue(Generic[R, T]):
         func: Callable[[T], Awaitable[R]],
         instance: T,
         name: str,
-        lock: AsyncContextManager[Any],
+        lock: Optional[AsyncContextManager[Any]],
     ):
         self._func = func
         self._instance = instance
@@ -89,6 +76,10 @@ class _FutureCachedPropertyValue(Generic[R, T]):
         self._lock = lock
 
     def __await__(self) -> Generator[None, None, R]:
+        # another task produced a value, or the instance.__dict__ object was
+        # deleted in the interim. Delegate without an intermediate coroutine.
+        if (stored := self._instance_value) is not self:
+            return stored.__await__()  # type: ignore
         return self._await_impl().__await__()
 
     @property
@@ -98,23 +89,26 @@ class _FutureCachedPropertyValue(Generic[R, T]):
         If the instance (no longer) has this attribute, it was deleted and the
         process is restarted by delegating to the descriptor.
         """
-        try:
-            return self._instance.__dict__[self._name]
-        except KeyError:
+        cache = self._instance.__dict__
+        if (stored := cache.get(self._name, _CACHE_MISSING)) is _CACHE_MISSING:
             # something deleted the cached value or future cached value placeholder. Restart
             # the fetch by delegating to the cached_property descriptor.
             return getattr(self._instance, self._name)
+        return stored
 
     async def _await_impl(self) -> R:
-        if (stored := self._instance_value) is self:
-            # attempt to get the lock
-            async with self._lock:
-                # check again for a cached value
-                if (stored := self._instance_value) is self:
-                    # the instance attribute is still this placeholder, and we
-                    # hold the lock. Start the getter to store the value on the
-                    # instance and return the value.
-                    return await self._get_attribute()
+        """Produce the value while this placeholder is stored on the instance"""
+        # without a lock there is no need to coordinate with other tasks
+        if (lock := self._lock) is None:
+            return await self._get_attribute()
+        # attempt to get the lock
+        async with lock:
+            # check again for a cached value
+            if (stored := self._instance_value) is self:
+                # the instance attribute is still this placeholder, and we
+                # hold the lock. Start the getter to store the value on the
+                # instance and return the value.
+                return await self._get_attribute()
 
         # another task produced a value, or the instance.__dict__ object was
         # deleted in the interim.
@@ -122,6 +116,7 @@ class _FutureCachedPropertyValue(Generic[R, T]):
 
     async def _get_attribute(self) -> R:
         value = await self._func(self._instance)
+        # look up ``__dict__`` again in case it was replaced in the meantime
         self._instance.__dict__[self._name] = AwaitableValue(value)
         return value
 
@@ -179,11 +174,18 @@ class CachedProperty(Generic[T, R]):
         # on this instance. It takes care of coordinating between different
         # tasks awaiting on the placeholder until the cached value has been
         # produced.
+        # The placeholder shadows this descriptor until it is deleted, so there is
+        # exactly one lock per fetch. A deleted placeholder must not share its lock
+        # with the next one, or the restarted fetch would wait for the stale one.
+        lock_type = self._asynccontextmanager_type
         wrapper = _FutureCachedPropertyValue(
-            self.func, instance, name, self._asynccontextmanager_type()
+            self.func,
+            instance,
+            name,
+            lock_type() if lock_type is not nullcontext else None,
         )
-        cache[name] = wrapper
-        return wrapper
+        # if another thread installed a placeholder or value meanwhile, use that
+        return cache.setdefault(name, wrapper)
 
 
 def cached_property(
@@ -298,16 +300,34 @@ async def reduce(
     and ``iterable`` contains exactly one item, it is returned without
     calling ``function``.
     """
+    # async iterators without ``aclose`` have nothing to clean up
+    if hasattr(iterable, "__anext__") and not hasattr(iterable, "aclose"):
+        return await _reduce(function, iterable, initial)  # type: ignore
     async with ScopedIter(iterable) as item_iter:
-        try:
-            value = (
-                initial if initial is not __REDUCE_SENTINEL else await anext(item_iter)
-            )
-        except StopAsyncIteration:
-            raise TypeError(
-                "reduce() of empty sequence with no initial value"
-            ) from None
-        function = _awaitify(function)
+        return await _reduce(function, item_iter, initial)
+
+
+async def _reduce(
+    function: Union[Callable[[T, T], T], Callable[[T, T], Awaitable[T]]],
+    item_iter: AsyncIterator[T],
+    initial: T,
+) -> T:
+    """Implementation of ``reduce`` for an async iterator"""
+    try:
+        value = (
+            initial if initial is not __REDUCE_SENTINEL else await item_iter.__anext__()
+        )
+    except StopAsyncIteration:
+        raise TypeError("reduce() of empty sequence with no initial value") from None
+    async for head in item_iter:
+        value, is_async = await probe_call(function, value, head)
+        break
+    else:
+        return value
+    if is_async:
+        async for head in item_iter:
+            value = await function(value, head)  # type: ignore
+    else:
         async for head in item_iter:
-            value = await function(value, head)
+            value = function(value, head)  # type: ignore
     return value
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import (
     Generic,
     AsyncIterator,
+    AsyncIterable,
     Optional,
     Callable,
     Any,
@@ -10,63 +11,66 @@ from typing import (
 )
 import heapq as _heapq
 
-from .builtins import enumerate as a_enumerate, zip as a_zip
-from ._core import aiter, awaitify, ScopedIter, borrow
+from .builtins import zip as a_zip
+from ._core import aiter, ScopedIter, borrow, probe_call
 from ._typing import AnyIterable, ACloseable, LT, T
 
+# the max-heap functions are only public since Python 3.14
+_heapify_max = getattr(_heapq, "heapify_max", None) or getattr(_heapq, "_heapify_max")
+_heapreplace_max = getattr(_heapq, "heapreplace_max", None) or getattr(
+    _heapq, "_heapreplace_max"
+)
+_heappop_max = getattr(_heapq, "heappop_max", None) or getattr(_heapq, "_heappop_max")
+
 
 class _KeyIter(Generic[LT]):
-    __slots__ = ("head", "tail", "reverse", "head_key", "key")
+    __slots__ = ("head", "tail", "head_key", "key", "_anext")
 
     @overload
     def __init__(
         self,
         head: T,
         tail: AsyncIterator[T],
-        reverse: bool,
         head_key: LT,
-        key: Callable[[T], Awaitable[LT]],
+        key: Callable[[T], Awaitable[LT]] | Callable[[T], LT],
     ) -> None: ...
 
     @overload
     def __init__(
-        self, head: LT, tail: AsyncIterator[LT], reverse: bool, head_key: LT, key: None
+        self, head: LT, tail: AsyncIterator[LT], head_key: LT, key: None
     ) -> None: ...
 
     def __init__(
         self,
         head: Any,
         tail: AsyncIterator[Any],
-        reverse: bool,
         head_key: LT,
         key: Any,
     ) -> None:
         self.head = head
         self.head_key = head_key
         self.tail = tail
+        self._anext = tail.__anext__
         self.key = key
-        self.reverse = reverse
 
     @overload
     @classmethod
     def from_iters(
         cls,
         iterables: "tuple[AnyIterable[T], ...]",
-        reverse: bool,
-        key: Callable[[T], Awaitable[LT]],
+        key: Callable[[T], Awaitable[LT]] | Callable[[T], LT],
     ) -> "AsyncIterator[_KeyIter[LT]]": ...
 
     @overload
     @classmethod
     def from_iters(
-        cls, iterables: "tuple[AnyIterable[LT], ...]", reverse: bool, key: None
+        cls, iterables: "tuple[AnyIterable[LT], ...]", key: None
     ) -> "AsyncIterator[_KeyIter[LT]]": ...
 
     @classmethod
     async def from_iters(
         cls,
         iterables: "tuple[AnyIterable[Any], ...]",
-        reverse: bool,
         key: Optional[Callable[[Any], Any]],
     ) -> "AsyncIterator[_KeyIter[Any]]":
         for iterable in iterables:
@@ -74,28 +78,57 @@ class _KeyIter(Generic[LT]):
             try:
                 head = await iterator.__anext__()
             except StopAsyncIteration:
-                pass
+                continue
+            if key is None:
+                yield cls(head, iterator, head, key)
             else:
-                head_key = await key(head) if key is not None else head
-                yield cls(head, iterator, reverse, head_key, key)
+                head_key, is_async = await probe_call(key, head)
+                if is_async:
+                    yield _AsyncKeyIter(head, iterator, head_key, key)
+                else:
+                    yield _SyncKeyIter(head, iterator, head_key, key)
 
     async def pull_head(self) -> bool:
         """
         Pull the next ``head`` element from the iterator and signal success
         """
         try:
-            self.head = head = await self.tail.__anext__()
+            self.head = head = await self._anext()
         except StopAsyncIteration:
             return False
         else:
-            self.head_key = await self.key(head) if self.key is not None else head
+            self.head_key = head
             return True
 
-    def __lt__(self, other: _KeyIter[LT]) -> bool:
-        return self.reverse ^ (self.head_key < other.head_key)
 
-    def __eq__(self, other: _KeyIter[LT]) -> bool:  # type: ignore[override]
-        return not (self.head_key < other.head_key or other.head_key < self.head_key)
+class _AsyncKeyIter(_KeyIter[LT]):
+    """A :py:class:`_KeyIter` whose ``key`` is an async callable"""
+
+    __slots__ = ()
+
+    async def pull_head(self) -> bool:
+        try:
+            self.head = head = await self._anext()
+        except StopAsyncIteration:
+            return False
+        else:
+            self.head_key = await self.key(head)
+            return True
+
+
+class _SyncKeyIter(_KeyIter[LT]):
+    """A :py:class:`_KeyIter` whose ``key`` is a regular callable"""
+
+    __slots__ = ()
+
+    async def pull_head(self) -> bool:
+        try:
+            self.head = head = await self._anext()
+        except StopAsyncIteration:
+            return False
+        else:
+            self.head_key = self.key(head)
+            return True
 
 
 async def merge(
@@ -120,91 +153,136 @@ async def merge(
     is yielded before ``b``. Use ``reverse=True`` for descending sort order.
     The ``iterables`` must be pre-sorted in the same order.
     """
-    a_key = awaitify(key) if key is not None else None
-    # sortable iterators with (reverse) position to ensure stable sort for ties
-    iter_heap: "list[tuple[_KeyIter[Any], int]]" = [
-        (itr, idx if not reverse else -idx)
-        async for idx, itr in a_enumerate(
-            _KeyIter[Any].from_iters(iterables, reverse, a_key)
+    # heap entries of [head_key, order, iterator] are compared natively,
+    # the order of the iterables ensures stable sort for ties
+    order = -1 if reverse else 1
+    iter_heap: "list[list[Any]]" = [
+        [itr.head_key, index * order, itr]
+        for index, itr in enumerate(
+            [itr async for itr in _KeyIter[Any].from_iters(iterables, key)]
         )
     ]
+    if reverse:
+        heapify, heapreplace, heappop = _heapify_max, _heapreplace_max, _heappop_max
+    else:
+        heapify, heapreplace, heappop = (
+            _heapq.heapify,
+            _heapq.heapreplace,
+            _heapq.heappop,
+        )
     try:
-        _heapq.heapify(iter_heap)
-        # there are at least two iterators that need merging
-        while len(iter_heap) > 1:
+        heapify(iter_heap)
+        # there are at least three iterators that need merging
+        while len(iter_heap) > 2:
             while True:
-                itr, idx = iter_heap[0]
+                entry = iter_heap[0]
+                itr = entry[2]
                 yield itr.head
                 if await itr.pull_head():
-                    _heapq.heapreplace(iter_heap, (itr, idx))
+                    entry[0] = itr.head_key
+                    # the current iterator stays in front as long as it beats
+                    # its children – skip the heap update while it is on a streak
+                    if reverse:
+                        if iter_heap[1] < entry and iter_heap[2] < entry:
+                            continue
+                    elif entry < iter_heap[1] and entry < iter_heap[2]:
+                        continue
+                    heapreplace(iter_heap, entry)
                 else:
-                    _heapq.heappop(iter_heap)
+                    heappop(iter_heap)
+                    break
+        # there are two iterators, which need just one comparison per item
+        if len(iter_heap) == 2:
+            entry, other = iter_heap
+            while True:
+                itr = entry[2]
+                yield itr.head
+                if not await itr.pull_head():
+                    iter_heap[:] = [other]
                     break
+                entry[0] = itr.head_key
+                if (entry < other) if reverse else (other < entry):
+                    entry, other = other, entry
         # there is only one iterator left, no need for merging
         if iter_heap:
-            itr, idx = iter_heap[0]
+            itr = iter_heap[0][2]
             yield itr.head
             async for item in itr.tail:
                 yield item
     finally:
-        for itr, _ in iter_heap:
+        for _, _, itr in iter_heap:
             if isinstance(itr.tail, ACloseable):
                 await itr.tail.aclose()
 
 
-class ReverseLT(Generic[LT]):
-    """Helper to reverse ``a < b`` ordering"""
-
-    __slots__ = ("key",)
-
-    def __init__(self, key: LT):
-        self.key = key
-
-    def __lt__(self, other: ReverseLT[LT]) -> bool:
-        return other.key < self.key
-
-
 # Python's heapq provides a *min*-heap
 # When finding the n largest items, heapq tracks the *minimum* item still large enough.
 # In other words, during search we maintain opposite sort order than what is requested.
-# We turn the min-heap into a max-sort in the end.
+# We turn the min-heap into a max-sort in the end. For the n smallest items, the same
+# applies to a *max*-heap and a min-sort.
 async def _largest(
     iterable: AnyIterable[T],
     n: int,
-    key: Callable[[T], Awaitable[LT]],
+    key: Callable[[T], Awaitable[LT]] | Callable[[T], LT] | None,
     reverse: bool,
 ) -> "list[T]":
-    ordered: Callable[[LT], LT] = ReverseLT if reverse else lambda x: x  # type: ignore
     async with ScopedIter(iterable) as iterator:
-        # assign an ordering to items to solve ties
-        order_sign = -1 if reverse else 1
+        items = [item async for _, item in a_zip(range(n), borrow(iterator))]
+        if not items:
+            return []
+        # without a key, items are their own keys
+        keys: "list[Any]" = items
+        async_key = False
+        if key is not None:
+            first_key, async_key = await probe_call(key, items[0])
+            keys = [first_key]
+            if async_key:
+                keys.extend([await key(item) for item in items[1:]])  # type: ignore
+            else:
+                keys.extend(map(key, items[1:]))
+        # assign an ordering to items to solve ties, so that
+        # later items are worse and earlier items are sorted first
+        order = 1 if reverse else -1
         n_heap = [
-            (ordered(await key(item)), index * order_sign, item)
-            async for index, item in a_zip(range(n), borrow(iterator))
+            (item_key, index * order, item)
+            for index, (item_key, item) in enumerate(zip(keys, items))
         ]
-        if not n_heap:
-            return []
-        _heapq.heapify(n_heap)
+        heapify, heapreplace = (
+            (_heapify_max, _heapreplace_max)
+            if reverse
+            else (_heapq.heapify, _heapq.heapreplace)
+        )
+        heapify(n_heap)
         worst_key = n_heap[0][0]
-        next_index = n * order_sign
-        async for item in iterator:
-            item_key = ordered(await key(item))
-            if worst_key < item_key:
-                _heapq.heapreplace(n_heap, (item_key, next_index, item))
-                worst_key = n_heap[0][0]
-                next_index += 1 * order_sign
-        n_heap.sort(reverse=True)
+        next_index = n * order
+        if key is None:
+            async for item in iterator:
+                if (item < worst_key) if reverse else (worst_key < item):
+                    heapreplace(n_heap, (item, next_index, item))
+                    worst_key = n_heap[0][0]
+                    next_index += order
+        elif async_key:
+            async for item in iterator:
+                item_key = await key(item)  # type: ignore
+                if (item_key < worst_key) if reverse else (worst_key < item_key):
+                    heapreplace(n_heap, (item_key, next_index, item))
+                    worst_key = n_heap[0][0]
+                    next_index += order
+        else:
+            async for item in iterator:
+                item_key = key(item)
+                if (item_key < worst_key) if reverse else (worst_key < item_key):
+                    heapreplace(n_heap, (item_key, next_index, item))
+                    worst_key = n_heap[0][0]
+                    next_index += order
+        n_heap.sort(reverse=not reverse)
     return [item for _, _, item in n_heap]
 
 
-async def _identity(x: T) -> T:
-    return x
-
-
 async def nlargest(
     iterable: AnyIterable[T],
     n: int,
-    key: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    key: Callable[[Any], Awaitable[Any]] | Callable[[Any], Any] | None = None,
 ) -> "list[T]":
     """
     Return a sorted list of the ``n`` largest elements from the (async) iterable
@@ -217,23 +295,21 @@ async def nlargest(
     The result is equivalent to ``sorted(iterable, key=key, reverse=True)[:n]``,
     but ``iterable`` is consumed lazily and items are discarded eagerly.
     """
-    a_key: Callable[[Any], Awaitable[Any]] = (
-        awaitify(key) if key is not None else _identity  # type: ignore
-    )
-    return await _largest(iterable=iterable, n=n, key=a_key, reverse=False)
+    if key is None and not isinstance(iterable, AsyncIterable):
+        return _heapq.nlargest(n, iterable)
+    return await _largest(iterable=iterable, n=n, key=key, reverse=False)
 
 
 async def nsmallest(
     iterable: AnyIterable[T],
     n: int,
-    key: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    key: Callable[[Any], Awaitable[Any]] | Callable[[Any], Any] | None = None,
 ) -> "list[T]":
     """
     Return a sorted list of the ``n`` smallest elements from the (async) iterable
 
     Provides the reverse functionality to :py:func:`~.nlargest`.
     """
-    a_key: Callable[[Any], Awaitable[Any]] = (
-        awaitify(key) if key is not None else _identity  # type: ignore
-    )
-    return await _largest(iterable=iterable, n=n, key=a_key, reverse=True)
+    if key is None and not isinstance(iterable, AsyncIterable):
+        return _heapq.nsmallest(n, iterable)
+    return await _largest(iterable=iterable, n=n, key=key, reverse=True)
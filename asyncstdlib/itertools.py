@@ -16,21 +16,21 @@ from typing import (
     cast,
     overload,
     AsyncGenerator,
+    AsyncIterable,
 )
 from collections import deque
+import operator
+import itertools as _sync_itertools
 
 from ._typing import ACloseable, R, T, AnyIterable, ADD
 from ._utility import public_module
 from ._core import (
     ScopedIter,
-    awaitify as _awaitify,
     Sentinel,
-    borrow as _borrow,
+    probe_call,
 )
 from .builtins import (
     anext,
-    zip,
-    enumerate as aenumerate,
     iter as aiter,
 )
 
@@ -103,6 +103,20 @@ async def accumulate(
                 current = await function(current, value)
                 yield current
     """
+    if function is add and not isinstance(iterable, AsyncIterable):
+        # a running sum of a regular iterable needs no awaiting
+        sync_iter = iter(iterable)
+        try:
+            value = initial if initial is not __ACCUMULATE_SENTINEL else next(sync_iter)
+        except StopIteration:
+            raise TypeError(
+                "accumulate() of empty sequence with no initial value"
+            ) from None
+        for value in _sync_itertools.accumulate(
+            _sync_itertools.chain((value,), sync_iter)
+        ):
+            yield value
+        return
     async with ScopedIter(iterable) as item_iter:
         try:
             value = (
@@ -114,11 +128,23 @@ async def accumulate(
             raise TypeError(
                 "accumulate() of empty sequence with no initial value"
             ) from None
-        function = _awaitify(function)
         yield value
+        if function is add:
+            function = operator.add
         async for head in item_iter:
-            value = await function(value, head)
-            yield value
+            value, is_async = await probe_call(function, value, head)
+            break
+        else:
+            return
+        yield value
+        if is_async:
+            async for head in item_iter:
+                value = await function(value, head)
+                yield value
+        else:
+            async for head in item_iter:
+                value = function(value, head)
+                yield value
 
 
 async def batched(
@@ -133,13 +159,22 @@ async def batched(
     """
     if n < 1:
         raise ValueError("n must be at least one")
+    if not isinstance(iterable, AsyncIterable):
+        # there is nothing to await for a regular iterable
+        sync_iter = iter(iterable)
+        while batch_items := tuple(_sync_itertools.islice(sync_iter, n)):
+            if strict and len(batch_items) < n:
+                raise ValueError("batched(): incomplete batch")
+            yield batch_items
+        return
     async with ScopedIter(iterable) as item_iter:
+        item_anext = item_iter.__anext__
         batch: list[T] = []
         try:
             while True:
                 batch.clear()
                 for _ in range(n):
-                    batch.append(await anext(item_iter))
+                    batch.append(await item_anext())
                 yield tuple(batch)
         except StopAsyncIteration:
             if batch:
@@ -219,8 +254,17 @@ async def compress(
         async def compress(data, selectors):
             return (item async for item, select in zip(data, selectors) if select)
     """
+    if not isinstance(data, AsyncIterable) and not isinstance(selectors, AsyncIterable):
+        for item in _sync_itertools.compress(data, selectors):
+            yield item
+        return
     async with ScopedIter(data) as data_iter, ScopedIter(selectors) as selectors_iter:
-        async for item, keep in zip(data_iter, selectors_iter):
+        selectors_anext = selectors_iter.__anext__
+        async for item in data_iter:
+            try:
+                keep = await selectors_anext()
+            except StopAsyncIteration:
+                return
             if keep:
                 yield item
 
@@ -238,11 +282,25 @@ async def dropwhile(
     for them.
     """
     async with ScopedIter(iterable) as async_iter:
-        predicate = _awaitify(predicate)
         async for item in async_iter:
-            if not await predicate(item):
-                yield item
-                break
+            drop, is_async = await probe_call(predicate, item)
+            break
+        else:
+            return
+        if drop:
+            if is_async:
+                async for item in async_iter:
+                    if not await predicate(item):
+                        break
+                else:
+                    return
+            else:
+                async for item in async_iter:
+                    if not predicate(item):
+                        break
+                else:
+                    return
+        yield item
         async for item in async_iter:
             yield item
 
@@ -258,11 +316,25 @@ async def filterfalse(
     """
     async with ScopedIter(iterable) as async_iter:
         if predicate is None:
-            predicate = bool
-        predicate = _awaitify(predicate)
+            async for item in async_iter:
+                if not item:
+                    yield item
+            return
         async for item in async_iter:
-            if not await predicate(item):
-                yield item
+            keep, is_async = await probe_call(predicate, item)
+            break
+        else:
+            return
+        if not keep:
+            yield item
+        if is_async:
+            async for item in async_iter:
+                if not await predicate(item):  # type: ignore
+                    yield item
+        else:
+            async for item in async_iter:
+                if not predicate(item):
+                    yield item
 
 
 async def islice(iterable: AnyIterable[T], *args: Optional[int]) -> AsyncIterator[T]:
@@ -278,27 +350,49 @@ async def islice(iterable: AnyIterable[T], *args: Optional[int]) -> AsyncIterato
     """
     s = slice(*args)
     start, stop, step = s.start or 0, s.stop, s.step or 1
+    skip = start
+    if skip > 0 and not isinstance(iterable, AsyncIterable):
+        # skip items of regular iterables without going through async iteration
+        iterable = iter(iterable)
+        next(_sync_itertools.islice(iterable, skip, skip), None)
+        skip = 0
     async with ScopedIter(iterable) as async_iter:
         # always consume the first ``start`` items, even if the slice is empty
-        if start > 0:
-            async for _count, element in aenumerate(_borrow(async_iter), start=1):
-                if _count == start:
+        if skip > 0:
+            async for _ in async_iter:
+                skip -= 1
+                if not skip:
                     break
         if stop is None:
-            async for idx, element in aenumerate(async_iter, start=0):
-                if not idx % step:
+            if step == 1:
+                async for element in async_iter:
                     yield element
+            else:
+                countdown = 0
+                async for element in async_iter:
+                    if not countdown:
+                        yield element
+                        countdown = step
+                    countdown -= 1
         elif stop <= start:
             return
         else:
-            # We would actually check ``idx >= stop -1`` later on.
-            # Since we do that for every ``idx``, we subtract ``1`` once here.
-            stop -= start + 1
-            async for idx, element in aenumerate(async_iter, start=0):
-                if not idx % step:
+            remaining = stop - start
+            if step == 1:
+                async for element in async_iter:
                     yield element
-                if idx >= stop:
-                    return
+                    remaining -= 1
+                    if not remaining:
+                        return
+            else:
+                idx = next_idx = 0
+                async for element in async_iter:
+                    if idx == next_idx:
+                        yield element
+                        next_idx += step
+                    idx += 1
+                    if idx == remaining:
+                        return
 
 
 async def starmap(
@@ -315,10 +409,19 @@ async def starmap(
     ``function(a, b)`` can be generalized to ``map(function, iter_a, iter_b)``,
     ``function(*c)`` can be generalized to ``starmap(function, iter_c)``.
     """
-    function = _awaitify(function)
     async with ScopedIter(iterable) as async_iter:
         async for args in async_iter:
-            yield await function(*args)
+            result, is_async = await probe_call(function, *args)
+            break
+        else:
+            return
+        yield result
+        if is_async:
+            async for args in async_iter:
+                yield await function(*args)  # type: ignore
+        else:
+            async for args in async_iter:
+                yield function(*args)  # type: ignore
 
 
 async def takewhile(
@@ -334,24 +437,26 @@ async def takewhile(
     ``iterable`` nor ``takewhile`` and effectively discarded.
     """
     async with ScopedIter(iterable) as async_iter:
-        predicate = _awaitify(predicate)
         async for item in async_iter:
-            if await predicate(item):
-                yield item
-            else:
-                break
-
-
-class NoLock:
-    """Dummy lock that provides the proper interface but no protection"""
-
-    __slots__ = ()
-
-    async def __aenter__(self) -> None:
-        pass
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        return None
+            keep, is_async = await probe_call(predicate, item)
+            break
+        else:
+            return
+        if not keep:
+            return
+        yield item
+        if is_async:
+            async for item in async_iter:
+                if await predicate(item):
+                    yield item
+                else:
+                    break
+        else:
+            async for item in async_iter:
+                if predicate(item):
+                    yield item
+                else:
+                    break
 
 
 async def tee_peer(
@@ -360,10 +465,23 @@ async def tee_peer(
     buffer: Deque[T],
     # the buffers of all peers, including our own
     peers: List[Deque[T]],
-    lock: AsyncContextManager[Any],
+    lock: Optional[AsyncContextManager[Any]],
 ) -> AsyncGenerator[T, None]:
     """An individual iterator of a :py:func:`~.tee`"""
     try:
+        if lock is None:
+            # Without a lock, no peer can produce an item while we fetch ours.
+            # Skip acquiring a dummy lock and checking the buffer again.
+            iterator_anext, buffer_popleft = iterator.__anext__, buffer.popleft
+            while True:
+                if not buffer:
+                    try:
+                        item = await iterator_anext()
+                    except StopAsyncIteration:
+                        return
+                    for peer_buffer in peers:
+                        peer_buffer.append(item)
+                yield buffer_popleft()
         while True:
             if not buffer:
                 async with lock:
@@ -450,7 +568,7 @@ class Tee(Generic[T]):
                 iterator=self._iterator,
                 buffer=buffer,
                 peers=self._buffers,
-                lock=lock if lock is not None else NoLock(),
+                lock=lock,
             )
             for buffer in self._buffers
         )
@@ -495,18 +613,15 @@ async def pairwise(iterable: AnyIterable[T]) -> AsyncIterator[Tuple[T, T]]:
     ``pairwise`` will wait for and consume it before finishing.
     """
     async with ScopedIter(iterable) as async_iter:
-        # any default is fine – we never yield it if there are not at least two items
-        prev = await anext(async_iter, None)
+        try:
+            prev = await async_iter.__anext__()
+        except StopAsyncIteration:
+            return
         async for current in async_iter:
-            yield prev, current  # type: ignore
+            yield prev, current
             prev = current
 
 
-async def _repeat(value: T) -> AsyncIterator[T]:
-    while True:
-        yield value
-
-
 async def zip_longest(
     *iterables: AnyIterable[Any], fillvalue: Any = None
 ) -> AsyncIterator[Tuple[Any, ...]]:
@@ -525,44 +640,45 @@ async def zip_longest(
     """
     if not iterables:
         return
-    fill_iter = aiter(_repeat(fillvalue))
     async_iters = [aiter(it) for it in iterables]
     del iterables
+    # exhausted iterators are replaced by ``None`` and padded with ``fillvalue``
+    anexts: "list[Optional[Callable[[], Awaitable[Any]]]]" = [
+        aiterator.__anext__ for aiterator in async_iters
+    ]
     try:
         remaining = len(async_iters)
         while True:
             values: list[Any] = []
-            for index, aiterator in enumerate(async_iters):
+            for index, aiterator_anext in enumerate(anexts):
+                if aiterator_anext is None:
+                    values.append(fillvalue)
+                    continue
                 try:
-                    value = await anext(aiterator)
+                    value = await aiterator_anext()
                 except StopAsyncIteration:
                     remaining -= 1
                     if not remaining:
                         return
-                    async_iters[index] = fill_iter
+                    anexts[index] = None
                     values.append(fillvalue)
                 else:
                     values.append(value)
                     del value
             yield tuple(values)
     finally:
-        await fill_iter.aclose()  # type: ignore
         for iterator in async_iters:
             if isinstance(iterator, ACloseable):
                 await iterator.aclose()
 
 
-async def identity(x: T) -> T:
-    """Asynchronous identity function, returns its argument unchanged"""
-    return x
-
-
 class _GroupByState(Generic[R, T_co]):
     """Internal state for the groupby iterator, shared between the parent and groups"""
 
     __slots__ = (
         "_iterator",
         "_key_func",
+        "_async_key",
         "_current_value",
         "target_key",
         "current_key",
@@ -572,16 +688,30 @@ class _GroupByState(Generic[R, T_co]):
     _sentinel = cast(T_co, object())
 
     def __init__(
-        self, iterator: AsyncIterator[T_co], key_func: Callable[[T_co], Awaitable[R]]
+        self,
+        iterator: AsyncIterator[T_co],
+        key_func: "Callable[[T_co], Awaitable[R]] | Callable[[T_co], R] | None",
     ):
         self._iterator = iterator
         self._key_func = key_func
+        # whether ``key_func`` is async, or None if not known yet
+        self._async_key: Optional[bool] = None
         self._current_value = self._sentinel
+        self.target_key: Any = self._sentinel
+        self.current_group: "Optional[_Grouper[R, T_co]]" = None
 
     async def step(self) -> None:
         # can raise StopAsyncIteration
-        value = await anext(self._iterator)
-        key = await self._key_func(value)
+        value = await self._iterator.__anext__()
+        key: Any
+        if (key_func := self._key_func) is None:
+            key = value
+        elif self._async_key:
+            key = await key_func(value)  # type: ignore
+        elif self._async_key is None:
+            key, self._async_key = await probe_call(key_func, value)
+        else:
+            key = key_func(value)
         self._current_value, self.current_key = value, key
 
     async def maybe_step(self) -> None:
@@ -666,25 +796,15 @@ class GroupBy(AsyncIterator[Tuple[R, AsyncIterator[T_co]]], Generic[R, T_co]):
             Union[Callable[[T_co], R], Callable[[T_co], Awaitable[R]]]
         ] = None,
     ):
-        key_func = (
-            cast(Callable[[T_co], Awaitable[R]], identity)
-            if key is None
-            else _awaitify(key)
-        )
-        self._state = _GroupByState(aiter(iterable), key_func)
+        self._state = _GroupByState(aiter(iterable), key)
 
     async def __anext__(self) -> Tuple[R, AsyncIterator[T_co]]:
         state = self._state
         # already disable the current group to avoid concurrency issues
         state.current_group = None
         await state.maybe_step()
-        try:
-            target_key = state.target_key
-        except AttributeError:
-            # no target key yet, skip scanning
-            pass
-        else:
-            # scan to the next group
+        # scan to the next group, unless there is no target key yet
+        if (target_key := state.target_key) is not state._sentinel:
             while state.current_key == target_key:
                 await state.step()
 
@@ -146,6 +146,7 @@ async def test_max_sa():
         return -x
 
     assert await a.max(asyncify((1, 2, 3, 4))) == 4
+    assert await a.max((1, 4, 3, 2)) == 4
     assert await a.max(asyncify((1, 4, 3, 2))) == 4
     assert await a.max(asyncify((1, 2, 3, 4)), key=lambda x: -x) == 1
     assert await a.max(asyncify((4, 2, 3, 1)), key=lambda x: -x) == 1
@@ -171,6 +172,7 @@ async def test_min_sa():
         return -x
 
     assert await a.min(asyncify((1, 2, 3, 4))) == 1
+    assert await a.min((4, 1, 3, 2)) == 1
     assert await a.min(asyncify((4, 1, 3, 2))) == 1
     assert await a.min(asyncify((1, 2, 3, 4)), key=lambda x: -x) == 4
     assert await a.min(asyncify((4, 2, 3, 1)), key=lambda x: -x) == 4
@@ -221,6 +223,16 @@ async def test_filter_aa():
     ] == list(range(4, 10, 2))
 
 
+@sync
+async def test_filter_empty():
+    def map_op(value):
+        return value % 2 == 0  # pragma: no cover
+
+    for predicate in (map_op, awaitify(map_op)):
+        assert [value async for value in a.filter(predicate, [])] == []
+        assert [value async for value in a.filter(predicate, asyncify([]))] == []
+
+
 @sync
 async def test_filter_na():
     assert [value async for value in a.filter(None, asyncify(range(5)))] == list(
@@ -247,6 +259,8 @@ async def test_sum():
     assert await a.sum(asyncify((1, 2, 3, 4))) == 10
     assert await a.sum(asyncify((4, 3, 2, 1)), start=5) == 15
     assert await a.sum((), start=5) == 5
+    assert await a.sum([1, 2, 3, 4]) == 10
+    assert await a.sum(range(5), start=5) == 15
 
 
 @sync
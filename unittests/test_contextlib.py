@@ -1,3 +1,5 @@
+from typing import AsyncIterator
+import inspect
 from functools import partial
 from contextlib import contextmanager
 
@@ -5,7 +7,7 @@ import pytest
 
 import asyncstdlib as a
 
-from .utility import sync
+from .utility import sync, Switch
 
 
 @sync
@@ -32,6 +34,34 @@ async def test_contextmanager():
         assert context == 1337
 
 
+@sync
+async def test_contextmanager_doc():
+    async def documented(value: int) -> AsyncIterator[int]:
+        """Context docstring"""
+        yield value
+
+    decorated = a.contextmanager(documented)
+    assert decorated.__name__ == "documented"
+    assert decorated.__doc__ == """Context docstring"""
+    assert decorated.__annotations__ == documented.__annotations__
+    assert decorated.__wrapped__ is documented
+    context = decorated(1337)
+    assert context.__doc__ == """Context docstring"""
+    assert context._recreate_cm().__doc__ == """Context docstring"""
+    async with context as value:
+        assert value == 1337
+
+
+@sync
+async def test_contextmanager_partial():
+    async def add(first, second):
+        yield first + second
+
+    decorated = a.contextmanager(partial(add, 1))
+    async with decorated(2) as value:
+        assert value == 3
+
+
 @sync
 async def test_contextmanager_decorator():
     witness: list[str] = []
@@ -227,6 +257,16 @@ async def test_contextmanager_no_suppress_generatorexit():
 async def test_nullcontext():
     async with a.nullcontext(1337) as value:
         assert value == 1337
+    context = a.nullcontext()
+    for _ in range(2):
+        async with context as value:
+            assert value is None
+    with pytest.raises(KeyError):
+        async with context:
+            raise KeyError()
+    # entering and exiting provide proper coroutines, e.g. for creating tasks
+    assert inspect.iscoroutinefunction(a.nullcontext.__aenter__)
+    assert inspect.iscoroutinefunction(a.nullcontext.__aexit__)
 
 
 class MockAsyncContext:
@@ -264,6 +304,15 @@ async def test_exist_stack():
             assert value == await exit_stack.enter_context(a.nullcontext(value))
 
 
+@sync
+async def test_exit_stack_empty():
+    async with a.ExitStack():
+        pass
+    with pytest.raises(KeyError):
+        async with a.ExitStack():
+            raise KeyError()
+
+
 @sync
 async def test_exit_stack_pop_all():
     async with a.ExitStack() as exit_stack:
@@ -344,6 +393,22 @@ async def test_exit_stack_push():
     assert exc_info.value.__context__ == seen[-1]
 
 
+@sync
+async def test_exit_stack_push_offload():
+    """Test that sync exit callbacks may be offloaded by returning an awaitable"""
+    context = MockContext()
+
+    async def offload(call, *args):
+        await Switch()
+        return call(*args)
+
+    with pytest.raises(KeyError):
+        async with a.ExitStack() as exit_stack:
+            exit_stack.push(lambda *exc: offload(context.__exit__, *exc))
+            raise KeyError()
+    assert context.exited
+
+
 @sync
 async def test_exit_stack_stitch_context():
     async def replace(exc_type, exc_val, tb, new):
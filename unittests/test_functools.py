@@ -28,6 +28,25 @@ async def test_cached_property():
     assert type(Pair.total) is CachedProperty
 
 
+@sync
+async def test_cached_property_dict_replaced():
+    class Counter:
+        def __init__(self):
+            self.calls = 0
+
+        @a.cached_property
+        async def count(self):
+            self.calls += 1
+            # replace the instance dict while the value is pending
+            self.__dict__ = {"calls": self.calls}
+            return self.calls
+
+    counter = Counter()
+    assert (await counter.count) == 1
+    assert (await counter.count) == 1
+    assert counter.calls == 1
+
+
 @sync
 async def test_cache_property_nodict():
     class Foo:
@@ -114,13 +133,29 @@ async def test_cache_property_lock_deletion():
     assert (await val.cached) == 12  # first value fetch after deletion
 
 
+class PlainAsyncIterator:
+    """Async iterator that does not support ``aclose``"""
+
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
 @sync
 async def test_reduce():
     async def reduction(x, y):
         return x + y
 
     for reducer in (reduction, lambda x, y: x + y):
-        for itertype in (asyncify, list):
+        for itertype in (asyncify, list, PlainAsyncIterator):
             assert await a.reduce(reducer, itertype([0, 1])) == functools.reduce(
                 lambda x, y: x + y, [0, 1]
             )
@@ -144,6 +179,8 @@ async def test_reduce_misuse():
         await a.reduce(lambda x, y: x + y, [])
     with pytest.raises(TypeError):
         await a.reduce(lambda x, y: x + y, asyncify([]))
+    with pytest.raises(TypeError):
+        await a.reduce(lambda x, y: x + y, PlainAsyncIterator([]))
     # make sure the stdlib behaves the same
     with pytest.raises(TypeError):
         functools.reduce(lambda x, y: x + y, [])
@@ -1,4 +1,5 @@
 import heapq
+import operator
 
 import pytest
 import random
@@ -34,19 +35,44 @@ async def test_merge_stdlib(samples, reverse):
 
 @pytest.mark.parametrize("samples", MERGE_SAMPLES)
 @pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("key", [lambda x: -x, awaitify(lambda x: -x)])
 @sync
-async def test_merge_stdlib_key(samples, reverse):
+async def test_merge_stdlib_key(samples, reverse, key):
     """Compare `heapq.merge` with key against stdlib implementation"""
     # use a key that reverses the result => must reverse input
     samples = samples if reverse else [sample[::-1] for sample in samples]
     assert list(heapq.merge(*samples, key=lambda x: -x, reverse=reverse)) == [
+        item
+        async for item in a.merge(*map(asyncify, samples), key=key, reverse=reverse)
+    ]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@sync
+async def test_merge_stable(reverse):
+    """Check that `heapq.merge` preserves the order of iterables for ties"""
+    samples = [[(i // 2, name) for i in range(6)] for name in "abc"]
+    samples = samples if not reverse else [sample[::-1] for sample in samples]
+    assert list(heapq.merge(*samples, key=lambda x: x[0], reverse=reverse)) == [
         item
         async for item in a.merge(
-            *map(asyncify, samples), key=awaitify(lambda x: -x), reverse=reverse
+            *map(asyncify, samples), key=lambda x: x[0], reverse=reverse
         )
     ]
 
 
+@sync
+async def test_merge_builtin_key():
+    """Check that `heapq.merge` accepts builtin callables as key"""
+    samples = [
+        [(i, name) for i in range(0, 12, step)] for step, name in enumerate("abc", 2)
+    ]
+    key = operator.itemgetter(0)
+    assert list(heapq.merge(*samples, key=key)) == [
+        item async for item in a.merge(*map(asyncify, samples), key=key)
+    ]
+
+
 MINMAX_SAMPLES = [
     [0, 3, 1, 4, 2, 5],
     [0, -3, 1, -4, -2, 5],
@@ -72,17 +98,41 @@ async def test_nlargest_stdlib(sample, n):
 
 @pytest.mark.parametrize("sample", MINMAX_SAMPLES)
 @pytest.mark.parametrize("n", [0, 1, 2, 10, 100, 400, 999, 1000, 1100])
+@pytest.mark.parametrize("key", [lambda x: -x, awaitify(lambda x: -x)])
 @sync
-async def test_nsmallest_stdlib_key(sample, n):
+async def test_nsmallest_stdlib_key(sample, n, key):
     assert heapq.nsmallest(n, sample, key=lambda x: -x) == await a.nsmallest(
-        asyncify(sample), n, key=lambda x: -x
+        asyncify(sample), n, key=key
     )
 
 
 @pytest.mark.parametrize("sample", MINMAX_SAMPLES)
 @pytest.mark.parametrize("n", [0, 1, 2, 10, 100, 400, 999, 1000, 1100])
+@pytest.mark.parametrize("key", [lambda x: -x, awaitify(lambda x: -x)])
 @sync
-async def test_nlargest_stdlib_key(sample, n):
+async def test_nlargest_stdlib_key(sample, n, key):
     assert heapq.nlargest(n, sample, key=lambda x: -x) == await a.nlargest(
-        asyncify(sample), n, key=lambda x: -x
+        asyncify(sample), n, key=key
     )
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 5, 10])
+@sync
+async def test_nsmallest_nlargest_stable(n):
+    """Check that `heapq.nsmallest/nlargest` preserve the order of items for ties"""
+    sample = [(i % 3, i) for i in range(9)]
+    for stdlib, asynclib in (
+        (heapq.nsmallest, a.nsmallest),
+        (heapq.nlargest, a.nlargest),
+    ):
+        assert stdlib(n, sample, key=lambda x: x[0]) == await asynclib(
+            asyncify(sample), n, key=lambda x: x[0]
+        )
+
+
+@pytest.mark.parametrize("sample", MINMAX_SAMPLES)
+@pytest.mark.parametrize("n", [0, 1, 2, 10])
+@sync
+async def test_nsmallest_nlargest_sync(sample, n):
+    assert heapq.nsmallest(n, sample) == await a.nsmallest(sample, n)
+    assert heapq.nlargest(n, sample) == await a.nlargest(sample, n)
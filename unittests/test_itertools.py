@@ -55,6 +55,8 @@ async def test_accumulate_default():
 async def test_accumulate_misuse():
     with pytest.raises(TypeError):
         assert await a.list(a.accumulate([]))
+    with pytest.raises(TypeError):
+        assert await a.list(a.accumulate(asyncify([])))
 
 
 batched_cases = [
@@ -80,10 +82,11 @@ async def test_batched_invalid(length):
 
 
 @sync
+@pytest.mark.parametrize("itertype", (list, asyncify))
 @pytest.mark.parametrize("values", ([1, 2, 3, 4], [1, 2, 3, 4, 5], [1]))
-async def test_batched_strict(values: "list[int]"):
+async def test_batched_strict(values: "list[int]", itertype):
     for n in range(1, len(values) + 1):
-        batches = a.batched(values, n, strict=True)
+        batches = a.batched(itertype(values), n, strict=True)
         if len(values) % n == 0:
             assert values == list(await a.reduce(lambda a, b: a + b, batches))
         else:
@@ -178,6 +181,7 @@ compress_cases = [
     (range(20), [idx % 2 for idx in range(20)]),
     ([1] * 5, [True, True, False, True, True]),
     ([1] * 128, [False]),
+    ([1, 2], [True] * 5),
     ([], []),
 ]
 
@@ -199,6 +203,7 @@ droptakewhile_cases = [
     ([1, 2, 3, 4] * 4, lambda x: x < 3),
     ([1, 2, 3, 4] * 4, lambda x: True),
     ([1, 2, 3, 4] * 4, lambda x: False),
+    ([], lambda x: True),
 ]
 
 
@@ -220,6 +225,7 @@ filterfalse_cases = (
     (lambda x: x, [0, 1] * 5),
     (lambda x: x < 5, range(20)),
     (lambda x: x > 5, range(20)),
+    (lambda x: True, []),
 )
 
 
@@ -287,6 +293,16 @@ async def test_islice_exact(slicing):
     )
 
 
+@sync
+@pytest.mark.parametrize("slicing", ((0,), (5,), (0, 20, 3), (5, 0, 1), (3, 50, 4)))
+async def test_islice_exact_sync(slicing):
+    """`isclice` consumes exactly as many items from regular iterators as needed"""
+    iterator, expected_iterator = iter(range(100)), iter(range(100))
+    expected = list(itertools.islice(expected_iterator, *slicing))
+    assert await a.list(a.islice(iterator, *slicing)) == expected
+    assert next(iterator) == next(expected_iterator)
+
+
 @sync
 async def test_islice_scoped_iter():
     """multiple `isclice` on borrowed iterator are consecutive"""
@@ -300,6 +316,7 @@ async def test_islice_scoped_iter():
 starmap_cases = [
     (lambda x, y: x + y, [(1, 2), (3, 4)]),
     (lambda *args: sum(args), [range(i) for i in range(1, 10)]),
+    (lambda x, y: x + y, []),
 ]
 
 
@@ -449,3 +466,24 @@ async def test_groupby(iterable, key, view):
         assert await view(a.groupby(asyncify(iterable), key=akey)) == await view(
             itertools.groupby(iterable, key=key)
         )
+
+
+@sync
+async def test_groupby_aclose():
+    closed = False
+
+    async def iter_values():
+        nonlocal closed
+        try:
+            for value in (1, 1, 2):
+                yield value
+        finally:
+            closed = True
+
+    # closing before fetching any group must not fail
+    await a.groupby(iter_values()).aclose()
+    groups = a.groupby(iter_values())
+    key, group = await a.anext(groups)
+    assert key == 1
+    await groups.aclose()
+    assert closed